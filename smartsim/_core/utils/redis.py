@@ -56,12 +56,8 @@ def create_cluster(hosts: t.List[str], ports: t.List[int]) -> None:  # cov-wlm
     :param ports: List of ports for each hostname
     :raises SmartSimError: if cluster creation fails
     """
-    ip_list = []
-    for host in hosts:
-        ip_address = get_ip_from_host(host)
-        for port in ports:
-            address = ":".join((ip_address, str(port) + " "))
-            ip_list.append(address)
+    ips = {host: get_ip_from_host(host) for host in hosts}
+    ip_list = [f"{ips[host]}:{port}" for host in hosts for port in ports]
 
     # call cluster command
     redis_cli = CONFIG.database_cli
@@ -84,13 +80,14 @@ def check_cluster_status(
 
     :param hosts: List of hostnames to connect to
     :param ports: List of ports for each hostname
-    :param trials: number of attempts to verify cluster status
+    :param trials: number of 5 second intervals to wait for the cluster
+        status to be verified
 
     :raises SmartSimError: If cluster status cannot be verified
     """
+    ips = {host: get_ip_from_host(host) for host in hosts}
     cluster_nodes = [
-        ClusterNode(get_ip_from_host(host), port)
-        for host, port in product(hosts, ports)
+        ClusterNode(ips[host], port) for host, port in product(hosts, ports)
     ]
 
     if not cluster_nodes:
@@ -99,22 +96,27 @@ def check_cluster_status(
         )
 
     logger.debug("Beginning database cluster status check...")
-    while trials > 0:
-        # wait for cluster to spin up
-        time.sleep(5)
-        try:
-            redis_tester: "RedisCluster[t.Any]" = RedisCluster(
-                startup_nodes=cluster_nodes
-            )
-            redis_tester.set("__test__", "__test__")
-            redis_tester.delete("__test__")  # type: ignore
-            logger.debug("Cluster status verified")
-            return
-        except (ClusterDownError, RedisClusterException, redis.RedisError):
-            logger.debug("Cluster still spinning up...")
-            trials -= 1
-    if trials == 0:
-        raise SSInternalError("Cluster setup could not be verified")
+    redis_tester: t.Optional["RedisCluster[t.Any]"] = None
+    deadline = time.monotonic() + 5 * trials
+    delay = 0.1
+    try:
+        while time.monotonic() < deadline:
+            # wait for cluster to spin up, backing off up to 5 seconds
+            time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+            delay = min(5.0, delay * 2)
+            try:
+                if redis_tester is None:
+                    redis_tester = RedisCluster(startup_nodes=cluster_nodes)
+                redis_tester.set("__test__", "__test__")
+                redis_tester.delete("__test__")  # type: ignore
+                logger.debug("Cluster status verified")
+                return
+            except (ClusterDownError, RedisClusterException, redis.RedisError):
+                logger.debug("Cluster still spinning up...")
+    finally:
+        if redis_tester is not None:
+            redis_tester.close()
+    raise SSInternalError("Cluster setup could not be verified")
 
 
 def db_is_active(hosts: t.List[str], ports: t.List[int], num_shards: int) -> bool:
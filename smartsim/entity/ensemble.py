@@ -24,10 +24,12 @@
 # OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import collections.abc
 import os.path as osp
 import typing as t
 from copy import deepcopy
 from os import getcwd
+from types import MappingProxyType
 
 from tabulate import tabulate
 
@@ -49,9 +51,18 @@ from .strategies import create_all_permutations, random_permutations, step_value
 logger = get_logger(__name__)
 
 StrategyFunction = t.Callable[
-    [t.List[str], t.List[t.List[str]], int], t.List[t.Dict[str, str]]
+    [t.List[str], t.List[t.List[str]], int],
+    t.Union[t.List[t.Dict[str, str]], t.Iterator[t.Dict[str, str]]],
 ]
 
+_STRATEGIES: t.Mapping[str, StrategyFunction] = MappingProxyType(
+    {
+        "all_perm": create_all_permutations,
+        "step": step_values,
+        "random": random_permutations,
+    }
+)
+
 
 class Ensemble(EntityList[Model]):
     """``Ensemble`` is a group of ``Model`` instances that can
@@ -86,7 +97,8 @@ class Ensemble(EntityList[Model]):
         :param perm_strategy: strategy for expanding ``params`` into
                              ``Model`` instances from params argument
                              options are "all_perm", "step", "random"
-                             or a callable function.
+                             or a callable function returning a list or
+                             iterator of parameter dictionaries.
         :return: ``Ensemble`` instance
         """
         self.params = params or {}
@@ -121,7 +133,8 @@ class Ensemble(EntityList[Model]):
                 # Compute all combinations of model parameters and arguments
                 n_models = kwargs.get("n_models", 0)
                 all_model_params = strategy(param_names, params, n_models)
-                if not isinstance(all_model_params, list):
+                # user strategies may return a list or a lazy iterator
+                if not isinstance(all_model_params, (list, collections.abc.Iterator)):
                     raise UserStrategyError(strategy)
 
                 for i, param_set in enumerate(all_model_params):
@@ -141,7 +154,8 @@ class Ensemble(EntityList[Model]):
                     logger.debug(
                         f"Created ensemble member: {model_name} in {self.name}"
                     )
-                    self.add_model(model)
+                    # generated names are unique, skip the add_model scan
+                    self.entities.append(model)
             # cannot generate models without run settings
             else:
                 raise SmartSimError(
@@ -163,7 +177,8 @@ class Ensemble(EntityList[Model]):
                         logger.debug(
                             f"Created ensemble member: {model_name} in {self.name}"
                         )
-                        self.add_model(model)
+                        # generated names are unique, skip the add_model scan
+                        self.entities.append(model)
                 else:
                     raise SmartSimError(
                         "Ensembles without 'params' or 'replicas' argument to "
@@ -256,10 +271,17 @@ class Ensemble(EntityList[Model]):
         :param to_symlink: files to symlink
         :param to_configure: input files with tagged parameters
         """
-        for model in self.models:
-            model.attach_generator_files(
-                to_copy=to_copy, to_symlink=to_symlink, to_configure=to_configure
-            )
+        if not self.entities:
+            return
+
+        # Validate and resolve the files once, then give each remaining
+        # member its own copy so members can be modified independently
+        first, *rest = self.entities
+        first.attach_generator_files(
+            to_copy=to_copy, to_symlink=to_symlink, to_configure=to_configure
+        )
+        for model in rest:
+            model.files = deepcopy(first.files)
 
     @property
     def attached_files_table(self) -> str:
@@ -292,12 +314,8 @@ class Ensemble(EntityList[Model]):
         :raises SSUnsupportedError: if str name is not supported
         :return: strategy function
         """
-        if strategy == "all_perm":
-            return create_all_permutations
-        if strategy == "step":
-            return step_values
-        if strategy == "random":
-            return random_permutations
+        if isinstance(strategy, str) and strategy in _STRATEGIES:
+            return _STRATEGIES[strategy]
         if callable(strategy):
             return strategy
         raise SSUnsupportedError(
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # Generation Strategies
+import math
 import random
 import typing as t
 from itertools import product
@@ -35,30 +36,43 @@ from itertools import product
 def create_all_permutations(
     param_names: t.List[str], param_values: t.List[t.List[str]], _n_models: int = 0
 ) -> t.List[t.Dict[str, str]]:
-    perms = list(product(*param_values))
-    all_permutations = []
-    for permutation in perms:
-        temp_model = dict(zip(param_names, permutation))
-        all_permutations.append(temp_model)
-    return all_permutations
+    return [
+        dict(zip(param_names, permutation)) for permutation in product(*param_values)
+    ]
 
 
 def step_values(
     param_names: t.List[str], param_values: t.List[t.List[str]], _n_models: int = 0
 ) -> t.List[t.Dict[str, str]]:
-    permutations = []
-    for param_value in zip(*param_values):
-        permutations.append(dict(zip(param_names, param_value)))
-    return permutations
+    return [dict(zip(param_names, step)) for step in zip(*param_values)]
 
 
 def random_permutations(
     param_names: t.List[str], param_values: t.List[t.List[str]], n_models: int = 0
 ) -> t.List[t.Dict[str, str]]:
-    permutations = create_all_permutations(param_names, param_values)
+    n_permutations = math.prod(len(values) for values in param_values)
 
     # sample from available permutations if n_models is specified
-    if n_models and n_models < len(permutations):
-        permutations = random.sample(permutations, n_models)
+    if 0 < n_models < n_permutations:
+        # sample indices into the product rather than building it first
+        indices = random.sample(range(n_permutations), n_models)
+        return [
+            _permutation_from_index(param_names, param_values, index)
+            for index in indices
+        ]
 
-    return permutations
+    return create_all_permutations(param_names, param_values)
+
+
+def _permutation_from_index(
+    param_names: t.List[str], param_values: t.List[t.List[str]], index: int
+) -> t.Dict[str, str]:
+    """Return the permutation found at ``index`` of the cartesian
+    product of ``param_values``, using the same ordering as
+    ``itertools.product``
+    """
+    permutation: t.List[str] = []
+    for values in reversed(param_values):
+        index, value_index = divmod(index, len(values))
+        permutation.append(values[value_index])
+    return dict(zip(param_names, reversed(permutation)))
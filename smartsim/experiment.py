@@ -463,7 +463,8 @@ class Experiment:
         :param perm_strategy: strategy for expanding ``params`` into
                               ``Model`` instances from params argument
                               options are "all_perm", "step", "random"
-                              or a callable function.
+                              or a callable function returning a list or
+                              iterator of parameter dictionaries.
         :raises SmartSimError: if initialization fails
         :return: ``Ensemble`` instance
         """
@@ -529,7 +529,7 @@ class RunSettings(SettingsBase):
             return []
 
         if isinstance(exe_args, list):
-            exe_args = copy.deepcopy(exe_args)
+            exe_args = list(exe_args)
 
         if not (
             isinstance(exe_args, str)
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 
+import os.path as osp
 from copy import deepcopy
 
 import pytest
@@ -56,6 +57,11 @@ def step_values(param_names, param_values, n_models=0):
     return permutations
 
 
+def step_values_gen(param_names, param_values, n_models=0):
+    for p in zip(*param_values):
+        yield dict(zip(param_names, p))
+
+
 # bad permutation strategy that doesn't return
 # a list of dictionaries
 def bad_strategy(names, values, n_models=0):
@@ -121,6 +127,31 @@ def test_random():
     assigned_params = [m.params["h"] for m in ensemble.entities]
     assert all([int(x) in random_ints for x in assigned_params])
 
+    # non-positive or oversized n_models returns every permutation
+    for n_models in (-1, len(random_ints) + 1):
+        ensemble = Ensemble(
+            "random_test",
+            params,
+            run_settings=rs,
+            perm_strat="random",
+            n_models=n_models,
+        )
+        assigned_params = [m.params["h"] for m in ensemble.entities]
+        assert assigned_params == [str(x) for x in random_ints]
+
+
+def test_random_multiple_params():
+    """Test random strategy samples unique permutations of all params"""
+    params = {"h": [5, 6, 7], "g": [8, 9], "f": [10, 11, 12, 13]}
+    all_perms = Ensemble("all_perm", params, run_settings=rs, perm_strat="all_perm")
+    ensemble = Ensemble(
+        "random_test", params, run_settings=rs, perm_strat="random", n_models=10
+    )
+    assert len(ensemble) == 10
+    assigned_params = [m.params for m in ensemble.entities]
+    assert all(p in [m.params for m in all_perms.entities] for p in assigned_params)
+    assert len({tuple(p.items()) for p in assigned_params}) == 10
+
 
 def test_user_strategy():
     """Test a user provided strategy"""
@@ -135,6 +166,15 @@ def test_user_strategy():
     assert ensemble.entities[1].params == model_2_params
 
 
+def test_user_strategy_generator():
+    """Test a user provided strategy that yields parameter sets"""
+    params = {"h": [5, 6], "g": [7, 8]}
+    ensemble = Ensemble("step", params, run_settings=rs, perm_strat=step_values_gen)
+    assert len(ensemble) == 2
+    assert ensemble.entities[0].params == {"h": "5", "g": "7"}
+    assert ensemble.entities[1].params == {"h": "6", "g": "8"}
+
+
 # ----- Model arguments -------------------------------------
 
 
@@ -287,6 +327,30 @@ def test_models_property():
     assert models == [model for model in e]
 
 
+def test_attach_generator_files(fileutils):
+    params = {"h": [5, 6, 7, 8]}
+    e = Ensemble("test", params, run_settings=rs)
+    script = fileutils.get_test_conf_path("sleep.py")
+    tag_dir = fileutils.get_test_conf_path(
+        osp.join("generator_files", "tag_dir_template")
+    )
+    e.attach_generator_files(to_copy=[script], to_configure=[tag_dir])
+    assert all(model.files.copy == [script] for model in e)
+    assert all(model.files.tagged == [tag_dir] for model in e)
+
+    # each member's files can be changed without affecting the others
+    first, *rest = e.models
+    first.files.copy.append(tag_dir)
+    first.files.tagged_hierarchy.files.add(script)
+    for model in rest:
+        assert model.files is not first.files
+        assert model.files.copy == [script]
+        assert script not in model.files.tagged_hierarchy.files
+        assert len(model.files.tagged_hierarchy.dirs) == len(
+            first.files.tagged_hierarchy.dirs
+        )
+
+
 def test_key_prefixing():
     params_1 = {"h": [5, 6, 7, 8]}
     params_2 = {"z": 6}
@@ -0,0 +1,123 @@
+# BSD 2-Clause License
+#
+# Copyright (c) 2021-2024, Hewlett Packard Enterprise
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+#
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import pytest
+
+from smartsim._core.utils import redis as redis_utils
+from smartsim.error import SSInternalError
+
+# The tests in this file belong to the group_a group
+pytestmark = pytest.mark.group_a
+
+
+class MockClock:
+    """Stand-in for ``time.monotonic``/``time.sleep`` that records sleeps"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class MockRedisCluster:
+    """Stand-in for ``RedisCluster`` that fails a set number of times"""
+
+    instances = []
+    failed_inits = 0
+    failed_sets = 0
+
+    def __init__(self, startup_nodes):
+        if MockRedisCluster.failed_inits > 0:
+            MockRedisCluster.failed_inits -= 1
+            raise redis_utils.RedisClusterException("cluster not ready")
+        self.startup_nodes = startup_nodes
+        self.closed = False
+        MockRedisCluster.instances.append(self)
+
+    def set(self, key, value):
+        if MockRedisCluster.failed_sets > 0:
+            MockRedisCluster.failed_sets -= 1
+            raise redis_utils.ClusterDownError("cluster down")
+
+    def delete(self, key):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = MockClock()
+    monkeypatch.setattr(redis_utils.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(redis_utils.time, "sleep", clock.sleep)
+    monkeypatch.setattr(redis_utils, "get_ip_from_host", lambda host: "127.0.0.1")
+    monkeypatch.setattr(redis_utils, "RedisCluster", MockRedisCluster)
+    monkeypatch.setattr(MockRedisCluster, "instances", [])
+    monkeypatch.setattr(MockRedisCluster, "failed_inits", 0)
+    monkeypatch.setattr(MockRedisCluster, "failed_sets", 0)
+    return clock
+
+
+def test_check_cluster_status_first_probe(clock):
+    redis_utils.check_cluster_status(["host"], [6780, 6781])
+    assert clock.sleeps == [pytest.approx(0.1)]
+    (client,) = MockRedisCluster.instances
+    assert len(client.startup_nodes) == 2
+    assert client.closed
+
+
+def test_check_cluster_status_retries_client_creation(clock):
+    MockRedisCluster.failed_inits = 1
+    MockRedisCluster.failed_sets = 1
+    redis_utils.check_cluster_status(["host"], [6780])
+    assert clock.sleeps == pytest.approx([0.1, 0.2, 0.4])
+    # the client is only created once the cluster can be reached
+    (client,) = MockRedisCluster.instances
+    assert client.closed
+
+
+def test_check_cluster_status_gives_up_after_deadline(clock):
+    MockRedisCluster.failed_sets = float("inf")
+    with pytest.raises(SSInternalError):
+        redis_utils.check_cluster_status(["host"], [6780], trials=2)
+    assert clock.now == pytest.approx(10.0)
+    assert max(clock.sleeps) <= 5.0
+    (client,) = MockRedisCluster.instances
+    assert client.closed
+
+
+def test_check_cluster_status_no_trials(clock):
+    with pytest.raises(SSInternalError):
+        redis_utils.check_cluster_status(["host"], [6780], trials=0)
+    assert not clock.sleeps
+    assert not MockRedisCluster.instances